@@ -4,7 +4,7 @@ __version__ = "0.1.0"
 
 from .app import FlashAPI
 from .request import Request
-from .response import JSONResponse, HTMLResponse, TextResponse, StreamResponse
+from .response import JSONResponse, HTMLResponse, TextResponse, StreamResponse, PrecomputedResponse
 from .middleware import Middleware, CORSMiddleware, CompressionMiddleware
 from .decorators import get, post, put, delete, patch, head, options
 from .validation import validate, Validator
@@ -15,7 +15,7 @@ from .exceptions import HTTPException, ValidationError
 __all__ = [
     "FlashAPI",
     "Request",
-    "JSONResponse", "HTMLResponse", "TextResponse", "StreamResponse",
+    "JSONResponse", "HTMLResponse", "TextResponse", "StreamResponse", "PrecomputedResponse",
     "Middleware", "CORSMiddleware", "CompressionMiddleware",
     "get", "post", "put", "delete", "patch", "head", "options",
     "validate", "Validator",
@@ -1,17 +1,23 @@
 import asyncio
 import time
 import inspect
+from collections import deque
+from functools import partial
 from typing import Dict, List, Callable, Any, Optional, Union
 from dataclasses import dataclass
 from .router import Router
 from .request import Request
-from .response import Response, JSONResponse
+from .response import Response, JSONResponse, TextResponse, PrecomputedResponse
 from .middleware import Middleware
 from .exceptions import HTTPException
 from .caching import MemoryCache
 from .background import BackgroundTaskManager
 
-@dataclass
+# Handler argument sources, resolved once at route registration
+ARG_PATH = object()
+ARG_REQUEST = object()
+
+@dataclass(slots=True)
 class FlashConfig:
     debug: bool = False
     title: str = "FlashAPI"
@@ -26,34 +32,80 @@ class FlashAPI:
         self.config = config or FlashConfig()
         self.router = Router()
         self.middleware: List[Middleware] = []
+        # Bound callbacks bucketed at registration; after-callbacks are kept
+        # in reverse registration order so dispatch avoids reversed()
+        self._before_middleware: List[Callable] = []
+        self._after_middleware: List[Callable] = []
         self.exception_handlers: Dict[Any, Callable] = {}
+        # (handler, is_coro) records split by key kind for O(MRO) dispatch
+        self._exc_by_type: Dict[type, tuple] = {}
+        self._exc_by_status: Dict[int, tuple] = {}
         self.startup_tasks: List[Callable] = []
         self.shutdown_tasks: List[Callable] = []
         self.cache = MemoryCache() if self.config.enable_caching else None
         self.background_tasks = BackgroundTaskManager()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
-        # Performance tracking
-        self.request_times: List[float] = []
+        # Performance tracking: bounded window for percentiles, running
+        # totals for the lifetime average
+        self.request_times: deque = deque(maxlen=1000)
+        self._request_time_sum = 0.0
+        self._request_count = 0
         self._setup_default_handlers()
     
     def _setup_default_handlers(self):
         """Setup default exception handlers"""
+        # Fixed error bodies are encoded once; hot 404 paths skip the JSON
+        # encoder entirely
+        self._not_found_body = JSONResponse({"error": "Not Found"})._encode_content()
+        self._server_error_body = JSONResponse({"error": "Internal Server Error"})._encode_content()
         self.add_exception_handler(HTTPException, self._handle_http_exception)
         self.add_exception_handler(500, self._handle_500_exception)
         self.add_exception_handler(404, self._handle_404_exception)
     
     def add_route(self, path: str, methods: List[str], handler: Callable, **kwargs):
         """Add route with performance optimizations"""
-        self.router.add_route(path, methods, handler, **kwargs)
+        route = self.router.add_route(path, methods, handler, **kwargs)
+        route.arg_plan = self._build_arg_plan(handler, route.pattern.groupindex)
+
+    def _build_arg_plan(self, handler: Callable, path_param_names) -> tuple:
+        """Precompute (name, source) pairs so dispatch skips per-request reflection"""
+        sig = inspect.signature(handler)
+        plan = []
+
+        for param_name, param in sig.parameters.items():
+            if param_name in path_param_names:
+                plan.append((param_name, ARG_PATH))
+            elif param_name == 'request':
+                plan.append((param_name, ARG_REQUEST))
+            elif param.annotation == Request:
+                # Auto-inject based on type hints
+                plan.append((param_name, ARG_REQUEST))
+
+        return tuple(plan)
     
     def add_middleware(self, middleware_class: type, **kwargs):
         """Add middleware with dependency injection"""
         middleware = middleware_class(**kwargs)
         self.middleware.append(middleware)
+
+        # Only collect hooks that actually override the Middleware base
+        before = getattr(middleware_class, 'before_request', None)
+        if before is not None and before is not Middleware.before_request:
+            self._before_middleware.append(middleware.before_request)
+
+        after = getattr(middleware_class, 'after_request', None)
+        if after is not None and after is not Middleware.after_request:
+            self._after_middleware.insert(0, middleware.after_request)
     
     def add_exception_handler(self, exc_class: Any, handler: Callable):
-        """Add exception handler"""
+        """Add exception handler for an exception class or status code"""
         self.exception_handlers[exc_class] = handler
+        entry = (handler, asyncio.iscoroutinefunction(handler))
+        if isinstance(exc_class, int):
+            self._exc_by_status[exc_class] = entry
+        else:
+            self._exc_by_type[exc_class] = entry
     
     def on_startup(self, func: Callable):
         """Register startup task"""
@@ -72,10 +124,8 @@ class FlashAPI:
             await self._handle_http_request(scope, receive, send)
             response_time = time.perf_counter() - start_time
             self.request_times.append(response_time)
-            
-            # Keep only last 1000 timings for stats
-            if len(self.request_times) > 1000:
-                self.request_times.pop(0)
+            self._request_time_sum += response_time
+            self._request_count += 1
     
     async def _handle_http_request(self, scope: Dict, receive: Callable, send: Callable):
         """Handle HTTP request with middleware pipeline"""
@@ -84,27 +134,32 @@ class FlashAPI:
         
         try:
             # Pre-process middleware
-            for middleware in self.middleware:
-                if hasattr(middleware, 'before_request'):
-                    request = await middleware.before_request(request) or request
+            for before_request in self._before_middleware:
+                request = await before_request(request) or request
             
             # Route matching
             route_match = self.router.find_route(request.path, request.method)
             if not route_match:
                 raise HTTPException(404, f"Route {request.path} not found")
             
-            handler, path_params, route_config = route_match
+            handler, path_params, route_config, arg_plan, is_coro = route_match
             request.path_params = path_params
-            
-            # Execute handler
-            handler_args = await self._prepare_handler_args(request, handler, path_params)
-            
-            if asyncio.iscoroutinefunction(handler):
+
+            # Execute handler with the precomputed arg plan
+            handler_args = {
+                name: path_params[name] if source is ARG_PATH else request
+                for name, source in arg_plan
+            }
+
+            if is_coro:
                 result = await handler(**handler_args)
             else:
                 # Run sync handlers in thread pool
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, handler, **handler_args
+                loop = self._loop
+                if loop is None:
+                    loop = self._loop = asyncio.get_event_loop()
+                result = await loop.run_in_executor(
+                    self.background_tasks.thread_pool, partial(handler, **handler_args)
                 )
             
             # Convert to response
@@ -114,29 +169,11 @@ class FlashAPI:
             response = await self._handle_exception(exc)
         
         # Post-process middleware
-        for middleware in reversed(self.middleware):
-            if hasattr(middleware, 'after_request'):
-                response = await middleware.after_request(request, response) or response
+        for after_request in self._after_middleware:
+            response = await after_request(request, response) or response
         
         await response(scope, receive, send)
     
-    async def _prepare_handler_args(self, request: Request, handler: Callable, path_params: Dict):
-        """Prepare handler arguments with dependency injection"""
-        sig = inspect.signature(handler)
-        handler_args = {}
-        
-        for param_name, param in sig.parameters.items():
-            if param_name in path_params:
-                handler_args[param_name] = path_params[param_name]
-            elif param_name == 'request':
-                handler_args[param_name] = request
-            elif param.annotation != inspect.Parameter.empty:
-                # Auto-inject based on type hints
-                if param.annotation == Request:
-                    handler_args[param_name] = request
-        
-        return handler_args
-    
     def _create_response(self, result: Any) -> Response:
         """Convert handler result to appropriate response"""
         if isinstance(result, Response):
@@ -150,13 +187,21 @@ class FlashAPI:
     
     async def _handle_exception(self, exc: Exception) -> Response:
         """Handle exceptions with registered handlers"""
-        for exc_class, handler in self.exception_handlers.items():
-            if isinstance(exc, exc_class) or exc_class == type(exc):
-                if asyncio.iscoroutinefunction(handler):
-                    return await handler(exc)
-                else:
-                    return handler(exc)
-        
+        # Walk the exception's MRO so subclass handlers win, without
+        # scanning every registered handler
+        for exc_class in type(exc).__mro__:
+            entry = self._exc_by_type.get(exc_class)
+            if entry is not None:
+                handler, is_coro = entry
+                return await handler(exc) if is_coro else handler(exc)
+
+        status_code = getattr(exc, 'status_code', None)
+        if status_code is not None:
+            entry = self._exc_by_status.get(status_code)
+            if entry is not None:
+                handler, is_coro = entry
+                return await handler(exc) if is_coro else handler(exc)
+
         # Default error response
         return JSONResponse(
             {"error": "Internal Server Error", "message": str(exc)},
@@ -170,28 +215,23 @@ class FlashAPI:
         )
     
     async def _handle_404_exception(self, exc: Exception) -> Response:
-        return JSONResponse(
-            {"error": "Not Found", "message": str(exc)},
-            status_code=404
-        )
-    
+        return PrecomputedResponse(self._not_found_body, status_code=404)
+
     async def _handle_500_exception(self, exc: Exception) -> Response:
-        return JSONResponse(
-            {"error": "Internal Server Error"},
-            status_code=500
-        )
+        return PrecomputedResponse(self._server_error_body, status_code=500)
     
     def get_stats(self) -> Dict:
         """Get performance statistics"""
         if not self.request_times:
             return {}
-        
+
+        window = sorted(self.request_times)
         return {
-            "total_requests": len(self.request_times),
-            "avg_response_time": sum(self.request_times) / len(self.request_times),
-            "min_response_time": min(self.request_times),
-            "max_response_time": max(self.request_times),
-            "p95_response_time": sorted(self.request_times)[int(len(self.request_times) * 0.95)]
+            "total_requests": self._request_count,
+            "avg_response_time": self._request_time_sum / self._request_count,
+            "min_response_time": window[0],
+            "max_response_time": window[-1],
+            "p95_response_time": window[int(len(window) * 0.95)]
         }
     
     def run(self, host: str = "127.0.0.1", port: int = 8000, **kwargs):
@@ -1,16 +1,19 @@
 import asyncio
-from typing import Callable, List, Dict, Any
+from typing import Callable, Set, Dict, Any
 from concurrent.futures import ThreadPoolExecutor
 
 class BackgroundTaskManager:
     def __init__(self, max_workers: int = 10):
-        self.tasks: List[asyncio.Task] = []
+        self.tasks: Set[asyncio.Task] = set()
         self.thread_pool = ThreadPoolExecutor(max_workers=max_workers)
-    
+
     def add_task(self, coro: Callable, *args, **kwargs):
         """Add a background task"""
         task = asyncio.create_task(coro(*args, **kwargs))
-        self.tasks.append(task)
+        # The set keeps the task alive until it finishes, then the done
+        # callback drops it so completed tasks don't accumulate
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
         return task
     
     def run_in_thread(self, func: Callable, *args, **kwargs):
@@ -22,11 +25,11 @@ class BackgroundTaskManager:
     async def wait_all(self):
         """Wait for all tasks to complete"""
         if self.tasks:
-            await asyncio.gather(*self.tasks, return_exceptions=True)
-    
+            await asyncio.gather(*list(self.tasks), return_exceptions=True)
+
     def cleanup(self):
         """Cancel all tasks and shutdown thread pool"""
-        for task in self.tasks:
+        for task in list(self.tasks):
             if not task.done():
                 task.cancel()
         self.thread_pool.shutdown(wait=True)
@@ -1,28 +1,34 @@
 import time
+from collections import OrderedDict
 from typing import Any, Optional
 from functools import wraps
 
 class MemoryCache:
-    def __init__(self):
-        self._cache = {}
-    
+    def __init__(self, max_size: int = 10_000):
+        self._cache: OrderedDict = OrderedDict()
+        self.max_size = max_size
+
     def get(self, key: str) -> Any:
-        if key in self._cache:
-            data, expiry = self._cache[key]
-            if expiry is None or time.time() < expiry:
-                return data
-            else:
-                del self._cache[key]
-        return None
-    
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        data, expiry = entry
+        if expiry is not None and time.monotonic() >= expiry:
+            self._cache.pop(key, None)
+            return None
+        self._cache.move_to_end(key)
+        return data
+
     def set(self, key: str, value: Any, ttl: Optional[int] = None):
-        expiry = time.time() + ttl if ttl else None
+        expiry = time.monotonic() + ttl if ttl else None
         self._cache[key] = (value, expiry)
-    
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
     def delete(self, key: str):
-        if key in self._cache:
-            del self._cache[key]
-    
+        self._cache.pop(key, None)
+
     def clear(self):
         self._cache.clear()
 
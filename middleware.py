@@ -1,8 +1,15 @@
-import gzip
 import time
+import zlib
 from typing import Optional
 from .request import Request
-from .response import Response
+from .response import Response, StreamResponse
+
+# Closed set of compressible media types; anything else under text/ is
+# caught by the prefix check
+_COMPRESSIBLE_TYPES = frozenset({
+    'application/json', 'application/javascript', 'application/xml',
+    'text/html', 'text/plain', 'text/css', 'text/xml',
+})
 
 class Middleware:
     async def before_request(self, request: Request) -> Optional[Request]:
@@ -13,24 +20,29 @@ class Middleware:
 
 class CORSMiddleware(Middleware):
     def __init__(self, allow_origins: list = None, allow_methods: list = None, allow_headers: list = None):
-        self.allow_origins = allow_origins or ["*"]
+        self.allow_origins = frozenset(allow_origins or ["*"])
         self.allow_methods = allow_methods or ["GET", "POST", "PUT", "DELETE", "PATCH"]
         self.allow_headers = allow_headers or ["Content-Type", "Authorization"]
-    
+        # The joined header values never change after construction
+        self._allow_any_origin = "*" in self.allow_origins
+        self._methods_header = ", ".join(self.allow_methods)
+        self._headers_header = ", ".join(self.allow_headers)
+
     async def after_request(self, request: Request, response: Response) -> Response:
         origin = request.get_header("origin")
-        
-        if origin and (origin in self.allow_origins or "*" in self.allow_origins):
+
+        if origin and (self._allow_any_origin or origin in self.allow_origins):
             response.headers["Access-Control-Allow-Origin"] = origin
-            response.headers["Access-Control-Allow-Methods"] = ", ".join(self.allow_methods)
-            response.headers["Access-Control-Allow-Headers"] = ", ".join(self.allow_headers)
+            response.headers["Access-Control-Allow-Methods"] = self._methods_header
+            response.headers["Access-Control-Allow-Headers"] = self._headers_header
             response.headers["Access-Control-Allow-Credentials"] = "true"
-        
+
         return response
 
 class CompressionMiddleware(Middleware):
-    def __init__(self, min_size: int = 500):
+    def __init__(self, min_size: int = 1024, compress_level: int = 6):
         self.min_size = min_size
+        self.compress_level = compress_level
     
     async def after_request(self, request: Request, response: Response) -> Response:
         accept_encoding = request.get_header('accept-encoding', '')
@@ -41,21 +53,41 @@ class CompressionMiddleware(Middleware):
         return response
     
     def _should_compress(self, response: Response) -> bool:
-        content_type = response.headers.get('content-type', '')
-        compressible_types = ['text/', 'application/json', 'application/javascript']
-        return any(ct in content_type for ct in compressible_types)
+        content_type = response.headers.get('content-type') or response.media_type or ''
+        content_type = content_type.split(';', 1)[0].strip().lower()
+        return content_type in _COMPRESSIBLE_TYPES or content_type.startswith('text/')
     
     async def _compress_response(self, response: Response) -> Response:
+        if isinstance(response, StreamResponse):
+            response.generator = self._compress_stream(response.generator)
+            response.headers['content-encoding'] = 'gzip'
+            return response
+
         content = response._encode_content()
         if len(content) < self.min_size:
             return response
-        
-        compressed = gzip.compress(content)
+
+        # wbits=31 emits gzip framing directly, skipping the GzipFile/BytesIO
+        # layering of gzip.compress
+        compressor = zlib.compressobj(self.compress_level, zlib.DEFLATED, 31)
+        compressed = compressor.compress(content) + compressor.flush()
         response.content = compressed
         response.headers['content-encoding'] = 'gzip'
         response.headers['content-length'] = str(len(compressed))
         return response
 
+    async def _compress_stream(self, generator):
+        compressor = zlib.compressobj(self.compress_level, zlib.DEFLATED, 31)
+        async for chunk in generator:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        tail = compressor.flush()
+        if tail:
+            yield tail
+
 class TimingMiddleware(Middleware):
     async def before_request(self, request: Request) -> Request:
         request.start_time = time.perf_counter()
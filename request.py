@@ -1,14 +1,30 @@
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Optional, List
 from urllib.parse import parse_qs
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared result for the common no-query-string case
+_EMPTY_QUERY_PARAMS: Dict[str, List[str]] = {}
+
 class Request:
+    # 'start_time' is set by TimingMiddleware, 'app' by embedding servers
+    __slots__ = (
+        'scope', 'receive', '_body', '_json', '_form', '_headers',
+        '_query_params', 'path_params', 'start_time', 'app',
+    )
+
     def __init__(self, scope: Dict, receive: Callable):
         self.scope = scope
         self.receive = receive
         self._body: Optional[bytes] = None
         self._json: Optional[Dict] = None
         self._form: Optional[Dict] = None
+        self._headers: Optional[Dict[str, str]] = None
+        self._query_params: Optional[Dict[str, List[str]]] = None
         self.path_params: Dict[str, Any] = {}
     
     @property
@@ -21,15 +37,22 @@ class Request:
     
     @property
     def headers(self) -> Dict[str, str]:
-        return {
-            key.decode().lower(): value.decode() 
-            for key, value in self.scope["headers"]
-        }
+        if self._headers is None:
+            self._headers = {
+                key.decode('latin-1').lower(): value.decode('latin-1')
+                for key, value in self.scope["headers"]
+            }
+        return self._headers
     
     @property
     def query_params(self) -> Dict[str, List[str]]:
-        query_string = self.scope.get("query_string", b"").decode()
-        return parse_qs(query_string)
+        if self._query_params is None:
+            query_string = self.scope.get("query_string", b"")
+            if not query_string:
+                self._query_params = _EMPTY_QUERY_PARAMS
+            else:
+                self._query_params = parse_qs(query_string.decode('latin-1'))
+        return self._query_params
     
     @property
     def client(self) -> str:
@@ -39,12 +62,19 @@ class Request:
     async def body(self) -> bytes:
         """Get request body with efficient streaming"""
         if self._body is None:
-            self._body = b""
+            chunks = []
             more_body = True
             while more_body:
                 message = await self.receive()
-                self._body += message.get("body", b"")
+                chunk = message.get("body", b"")
+                if chunk:
+                    chunks.append(chunk)
                 more_body = message.get("more_body", False)
+            # Single-chunk bodies (the common case) skip the join
+            if len(chunks) == 1:
+                self._body = chunks[0]
+            else:
+                self._body = b"".join(chunks)
         return self._body
     
     async def json(self) -> Optional[Dict[str, Any]]:
@@ -53,8 +83,9 @@ class Request:
             body = await self.body()
             if body:
                 try:
-                    self._json = json.loads(body)
-                except json.JSONDecodeError:
+                    # orjson decodes bytes directly and is 2-3x faster
+                    self._json = orjson.loads(body) if orjson is not None else json.loads(body)
+                except ValueError:
                     self._json = {}
         return self._json
     
@@ -71,7 +102,14 @@ class Request:
     
     def get_header(self, name: str, default: Any = None) -> Optional[str]:
         """Get specific header with case-insensitive lookup"""
-        return self.headers.get(name.lower(), default)
+        if self._headers is not None:
+            return self._headers.get(name.lower(), default)
+        # Cache is cold: scan the raw header pairs without decoding them all
+        name_bytes = name.lower().encode('latin-1')
+        for key, value in self.scope["headers"]:
+            if key.lower() == name_bytes:
+                return value.decode('latin-1')
+        return default
     
     def get_query_param(self, name: str, default: Any = None) -> Any:
         """Get single query parameter"""
@@ -1,9 +1,33 @@
 import json
-import time
 from typing import Any, Dict, Optional, AsyncGenerator
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Exact-type dispatch for the overwhelmingly common body types; avoids
+# the isinstance chain on every response
+_CONTENT_ENCODERS = {
+    bytes: lambda content: content,
+    str: str.encode,
+}
+
+# Header names come from a small closed set, so encode each one once
+_HEADER_NAME_CACHE: Dict[str, bytes] = {}
+
+def _header_name_bytes(name: str) -> bytes:
+    cached = _HEADER_NAME_CACHE.get(name)
+    if cached is None:
+        cached = _HEADER_NAME_CACHE[name] = name.lower().encode('latin-1')
+    return cached
 
 class Response:
+    __slots__ = (
+        'content', 'status_code', 'headers', 'media_type',
+        '_media_type_bytes',
+    )
+
     def __init__(
         self,
         content: Any,
@@ -15,23 +39,20 @@ class Response:
         self.status_code = status_code
         self.headers = headers or {}
         self.media_type = media_type
-        self.timestamp = datetime.utcnow()
+        self._media_type_bytes = media_type.encode('latin-1')
     
     async def __call__(self, scope, receive, send):
         """ASGI response implementation"""
         body = self._encode_content()
-        
+
         headers = [
-            (b"content-type", self.media_type.encode()),
-            (b"content-length", str(len(body)).encode()),
+            (b"content-type", self._media_type_bytes),
+            (b"content-length", f"{len(body)}".encode('ascii')),
         ]
-        
+
         # Add custom headers
         for key, value in self.headers.items():
-            headers.append((key.lower().encode(), value.encode()))
-        
-        # Add performance headers
-        headers.append((b"x-response-time", str(int(time.time() * 1000)).encode()))
+            headers.append((_header_name_bytes(key), value.encode('latin-1')))
         
         await send({
             "type": "http.response.start",
@@ -46,14 +67,14 @@ class Response:
     
     def _encode_content(self) -> bytes:
         """Encode content to bytes"""
-        if isinstance(self.content, bytes):
-            return self.content
-        elif isinstance(self.content, str):
-            return self.content.encode('utf-8')
-        else:
-            return str(self.content).encode('utf-8')
+        encoder = _CONTENT_ENCODERS.get(type(self.content))
+        if encoder is not None:
+            return encoder(self.content)
+        return str(self.content).encode('utf-8')
 
 class JSONResponse(Response):
+    __slots__ = ('json_kwargs',)
+
     def __init__(
         self,
         content: Any,
@@ -65,9 +86,44 @@ class JSONResponse(Response):
         self.json_kwargs = json_kwargs
     
     def _encode_content(self) -> bytes:
-        return json.dumps(self.content, **self.json_kwargs).encode('utf-8')
+        if isinstance(self.content, bytes):
+            # Already encoded upstream (e.g. by CompressionMiddleware)
+            return self.content
+        if orjson is not None and not (self.json_kwargs.keys() - {'sort_keys', 'indent'}):
+            # orjson emits bytes directly, skipping the str -> utf-8 re-encode
+            option = 0
+            if self.json_kwargs.get('sort_keys'):
+                option |= orjson.OPT_SORT_KEYS
+            if self.json_kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(self.content, default=str, option=option)
+        # Stdlib fallback: stream encoder chunks into a bytearray instead of
+        # building the full str and re-encoding it in one shot
+        buf = bytearray()
+        encoder = json.JSONEncoder(**self.json_kwargs)
+        for chunk in encoder.iterencode(self.content):
+            buf += chunk.encode('utf-8')
+        return bytes(buf)
+
+class PrecomputedResponse(Response):
+    """Response built from body bytes encoded ahead of time"""
+    __slots__ = ()
+
+    def __init__(
+        self,
+        body: bytes,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        media_type: str = "application/json"
+    ):
+        super().__init__(body, status_code, headers, media_type)
+
+    def _encode_content(self) -> bytes:
+        return self.content
 
 class HTMLResponse(Response):
+    __slots__ = ()
+
     def __init__(
         self,
         content: str,
@@ -77,6 +133,8 @@ class HTMLResponse(Response):
         super().__init__(content, status_code, headers, "text/html; charset=utf-8")
 
 class TextResponse(Response):
+    __slots__ = ()
+
     def __init__(
         self,
         content: str,
@@ -86,6 +144,8 @@ class TextResponse(Response):
         super().__init__(content, status_code, headers, "text/plain; charset=utf-8")
 
 class StreamResponse(Response):
+    __slots__ = ('generator',)
+
     def __init__(
         self,
         generator: AsyncGenerator,
@@ -99,12 +159,12 @@ class StreamResponse(Response):
     async def __call__(self, scope, receive, send):
         """Streaming response implementation"""
         headers = [
-            (b"content-type", self.media_type.encode()),
+            (b"content-type", self._media_type_bytes),
             (b"transfer-encoding", b"chunked"),
         ]
-        
+
         for key, value in self.headers.items():
-            headers.append((key.lower().encode(), value.encode()))
+            headers.append((_header_name_bytes(key), value.encode('latin-1')))
         
         await send({
             "type": "http.response.start",
@@ -1,101 +1,426 @@
+import asyncio
 import re
+import sys
 import inspect
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Callable, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass
+# Regex fragments for typed path parameters, shared by the regex compiler
+# and the trie's per-segment validators
+_TYPE_MAP = {'int': r'\d+', 'str': r'[^/]+', 'float': r'\d+\.?\d*', 'uuid': r'[0-9a-f-]+'}
+
+# A path segment that is exactly one parameter: {name} or {name:type}
+_SEGMENT_PARAM_RE = re.compile(r'^\{(\w+)(?::(\w+))?\}$')
+
+# Parameter tokens inside a path template, typed or not, compiled once
+# instead of per route registration
+_PARAM_RE = re.compile(r'\{(\w+)(?::(\w+))?\}')
+
+_SEGMENT_PATTERN_CACHE: Dict[str, re.Pattern] = {}
+
+def _segment_pattern(param_type: str) -> re.Pattern:
+    """Compiled validator for a single typed segment"""
+    pattern = _SEGMENT_PATTERN_CACHE.get(param_type)
+    if pattern is None:
+        pattern = _SEGMENT_PATTERN_CACHE[param_type] = re.compile(
+            _TYPE_MAP.get(param_type, r'[^/]+')
+        )
+    return pattern
+
+@dataclass(slots=True)
 class RouteConfig:
     cache_ttl: int = 0
     rate_limit: int = 0
-    background_tasks: List[str] = None
+    background_tasks: List[str] = field(default_factory=list)
     validate: bool = True
 
 class Route:
+    __slots__ = (
+        'path', 'methods', 'handler', 'config', 'pattern', 'param_types',
+        '_untyped_names', 'is_coro', '_match_fn', 'arg_plan',
+        '_cached_result', '_static_prefix', '_segment_count',
+    )
+
     def __init__(self, path: str, methods: List[str], handler: Callable, config: RouteConfig = None):
         self.path = path
-        self.methods = methods
+        # Interned method strings let dict probes hit the pointer-equality
+        # fast path; request methods arrive as interned constants already
+        self.methods = frozenset(sys.intern(method.upper()) for method in methods)
         self.handler = handler
         self.config = config or RouteConfig()
         self.pattern, self.param_types = self._compile_pattern(path)
+        self._untyped_names = tuple(
+            name for name in self.pattern.groupindex if name not in self.param_types
+        )
+        # Resolved once here instead of per dispatch
+        self.is_coro = asyncio.iscoroutinefunction(handler)
+        # Specialized matcher generated for segment-shaped paths; None
+        # means match() uses the compiled regex
+        self._match_fn = self._compile_matcher()
+        # Filled in by the app at registration time
+        self.arg_plan: tuple = ()
+        # Full find_route result for static routes, built on first hit
+        # (after the app has attached the arg plan) and reused verbatim
+        self._cached_result: Optional[tuple] = None
+        # Cheap guards precomputed once: parameters never span '/', so a
+        # candidate path must share the literal prefix and segment count
+        brace = path.find('{')
+        self._static_prefix = path if brace == -1 else path[:brace]
+        self._segment_count = path.count('/')
     
     def _compile_pattern(self, path: str) -> Tuple[re.Pattern, Dict[str, type]]:
         """Compile route pattern with type support"""
-        # Extract type hints from path parameters
-        type_pattern = re.compile(r'\{(\w+):(\w+)\}')
-        basic_pattern = re.compile(r'\{(\w+)\}')
-        
         param_types = {}
-        path_regex = path
-        
-        # Handle typed parameters: {id:int}, {name:str}, {price:float}
-        for match in type_pattern.finditer(path):
+
+        # One linear pass handles {id:int}, {name:str}, {price:float} and
+        # untyped {name} alike
+        def _replace(match: re.Match) -> str:
             param_name, param_type = match.groups()
-            type_map = {'int': r'\d+', 'str': r'[^/]+', 'float': r'\d+\.?\d*', 'uuid': r'[0-9a-f-]+'}
-            param_types[param_name] = param_type
-            path_regex = path_regex.replace(
-                f'{{{param_name}:{param_type}}}', 
-                f'(?P<{param_name}>{type_map.get(param_type, r"[^/]+")})'
-            )
-        
-        # Handle untyped parameters
-        for match in basic_pattern.finditer(path_regex):
-            param_name = match.group(1)
-            path_regex = path_regex.replace(f'{{{param_name}}}', f'(?P<{param_name}>[^/]+)')
-        
-        return re.compile(f"^{path_regex}$"), param_types
+            if param_type:
+                param_types[param_name] = param_type
+            return f'(?P<{param_name}>{_TYPE_MAP.get(param_type, r"[^/]+")})'
+
+        # No ^...$ anchors: match() uses fullmatch(), and unanchored
+        # sources drop straight into the fallback alternation regex
+        path_regex = _PARAM_RE.sub(_replace, path)
+        return re.compile(path_regex), param_types
     
+    def _compile_matcher(self) -> Optional[Callable[[str], Optional[Dict[str, Any]]]]:
+        """Generate a per-route matcher function, bypassing the regex engine
+
+        Literal segments become equality tests and typed params become a
+        validator plus direct conversion, all specialized into one compiled
+        function. Paths with params embedded in literal text keep the regex.
+        """
+        if not self.path.startswith('/'):
+            return None
+
+        segments = self.path.split('/')[1:]
+        lines = [
+            "def _match(path):",
+            "    parts = path.split('/')",
+            f"    if len(parts) != {len(segments) + 1}:",
+            "        return None",
+            "    params = {}",
+        ]
+        namespace: Dict[str, Any] = {}
+
+        for i, segment in enumerate(segments, start=1):
+            param = _SEGMENT_PARAM_RE.match(segment)
+            if param is None:
+                if '{' in segment:
+                    return None
+                lines.append(f"    if parts[{i}] != {segment!r}:")
+                lines.append("        return None")
+                continue
+
+            param_name, param_type = param.groups()
+            if param_type == 'int':
+                # isdecimal matches the \d+ pattern and guarantees int()
+                lines.append(f"    if not parts[{i}].isdecimal():")
+                lines.append("        return None")
+                lines.append(f"    params[{param_name!r}] = int(parts[{i}])")
+            elif param_type:
+                namespace[f'_pattern{i}'] = _segment_pattern(param_type)
+                lines.append(f"    if _pattern{i}.fullmatch(parts[{i}]) is None:")
+                lines.append("        return None")
+                converter = _CONVERTERS.get(param_type)
+                if converter is not None:
+                    namespace[f'_convert{i}'] = converter
+                    lines.append(f"    params[{param_name!r}] = _convert{i}(parts[{i}])")
+                else:
+                    lines.append(f"    params[{param_name!r}] = parts[{i}]")
+            else:
+                lines.append(f"    if not parts[{i}]:")
+                lines.append("        return None")
+                lines.append(f"    params[{param_name!r}] = parts[{i}]")
+
+        lines.append("    return params")
+        code = compile('\n'.join(lines), f'<route {self.path}>', 'exec')
+        exec(code, namespace)
+        return namespace['_match']
+
     def match(self, path: str, method: str) -> Optional[Dict[str, Any]]:
         """Match route and convert parameters to proper types"""
-        if method not in self.methods:
+        if method.upper() not in self.methods:
+            return None
+
+        if self._match_fn is not None:
+            return self._match_fn(path)
+
+        if not path.startswith(self._static_prefix) or path.count('/') != self._segment_count:
             return None
-        
-        match = self.pattern.match(path)
+
+        match = self.pattern.fullmatch(path)
         if not match:
             return None
-        
-        params = match.groupdict()
-        # Convert parameter types
-        for param_name, value in params.items():
-            if param_name in self.param_types:
-                param_type = self.param_types[param_name]
-                try:
-                    if param_type == 'int':
-                        params[param_name] = int(value)
-                    elif param_type == 'float':
-                        params[param_name] = float(value)
-                    elif param_type == 'bool':
-                        params[param_name] = value.lower() in ('true', '1', 'yes')
-                except (ValueError, TypeError):
-                    # If conversion fails, keep as string
-                    pass
-        
+
+        # Pull groups by name instead of allocating a full groupdict and
+        # re-testing membership per entry
+        params = {}
+        for name, param_type in self.param_types.items():
+            value = match.group(name)
+            converter = _CONVERTERS.get(param_type)
+            # The type's regex only admits convertible values, so the call
+            # runs unguarded -- no exception frame per typed param
+            params[name] = converter(value) if converter is not None else value
+        for name in self._untyped_names:
+            params[name] = match.group(name)
         return params
 
+    def _convert_params(self, params: Dict[str, Any]):
+        """Convert matched string parameters to their declared types in place"""
+        for param_name, param_type in self.param_types.items():
+            converter = _CONVERTERS.get(param_type)
+            if converter is not None:
+                # Guaranteed valid by the type's regex; see match()
+                params[param_name] = converter(params[param_name])
+
+_TRUE_SET = frozenset({'true', '1', 'yes', 'on'})
+
+def _to_bool(value: str) -> bool:
+    return value.lower() in _TRUE_SET
+
+# Converters for typed parameters, keyed by declared type
+_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    'int': int,
+    'float': float,
+    'bool': _to_bool,
+}
+
+class TrieNode:
+    """One path segment in the route trie"""
+    __slots__ = (
+        'children', 'param_child', 'param_name', 'param_pattern',
+        'param_converter', 'routes',
+    )
+
+    def __init__(self):
+        self.children: Dict[str, 'TrieNode'] = {}
+        self.param_child: Optional['TrieNode'] = None
+        self.param_name: Optional[str] = None
+        self.param_pattern: Optional[re.Pattern] = None
+        self.param_converter: Optional[Callable[[str], Any]] = None
+        self.routes: Dict[str, Route] = {}
+
 class Router:
     def __init__(self):
         self.routes: List[Route] = []
-        self._route_cache: Dict[Tuple[str, str], Tuple[Callable, Dict, RouteConfig]] = {}
-    
-    def add_route(self, path: str, methods: List[str], handler: Callable, **kwargs):
+        # Fully-literal routes resolve with one dict lookup
+        self._static: Dict[Tuple[str, str], Route] = {}
+        self._root = TrieNode()
+        # Routes the trie cannot represent (params embedded mid-segment,
+        # conflicting param names at the same position) go through one
+        # combined alternation regex per method, rebuilt lazily
+        self._fallback_routes: List[Route] = []
+        self._fallback_matchers: Optional[Dict[str, tuple]] = None
+        # Literal first segments of the fallback routes; paths whose first
+        # segment is absent skip the alternation regex entirely
+        self._first_segments: frozenset = frozenset()
+        self._any_first_segment = False
+        # LRU cache of resolved (path, method) lookups
+        self._route_cache: OrderedDict = OrderedDict()
+        self._cache_max = 1024
+
+    def add_route(self, path: str, methods: List[str], handler: Callable, **kwargs) -> Route:
         """Add route with configuration"""
         config = RouteConfig(**kwargs)
         route = Route(path, methods, handler, config)
         self.routes.append(route)
-        # Clear cache when adding new routes
-        self._route_cache.clear()
-    
-    def find_route(self, path: str, method: str) -> Optional[Tuple[Callable, Dict, RouteConfig]]:
+        if '{' not in path:
+            path = sys.intern(path)
+            for method in route.methods:
+                # First registration wins, matching the old linear scan
+                self._static.setdefault((path, method), route)
+        elif not self._insert_into_trie(route):
+            self._fallback_routes.append(route)
+            self._fallback_matchers = None
+            self._rebuild_first_segments()
+        # Drop only cached lookups the new route could affect, keeping the
+        # rest of the cache warm
+        if self._route_cache:
+            stale = [
+                key for key in self._route_cache
+                if route.match(key[0], key[1]) is not None
+            ]
+            for key in stale:
+                del self._route_cache[key]
+        return route
+
+    def _rebuild_first_segments(self):
+        """Recompute the first-segment prefilter over the fallback routes"""
+        literals = set()
+        any_first = False
+        for route in self._fallback_routes:
+            if not route.path.startswith('/'):
+                any_first = True
+                continue
+            first = route.path.split('/', 2)[1]
+            if '{' in first:
+                # Parameter in the first segment: the filter can't prune
+                any_first = True
+            else:
+                literals.add(first)
+        self._first_segments = frozenset(literals)
+        self._any_first_segment = any_first
+
+    def _cache_store(self, cache_key: Tuple[str, str], result: tuple):
+        self._route_cache[cache_key] = result
+        if len(self._route_cache) > self._cache_max:
+            self._route_cache.popitem(last=False)
+
+    def _insert_into_trie(self, route: Route) -> bool:
+        """Insert a route into the segment trie; False if it needs the regex path"""
+        if not route.path.startswith('/'):
+            return False
+
+        node = self._root
+        for segment in route.path.split('/')[1:]:
+            param = _SEGMENT_PARAM_RE.match(segment)
+            if param is None:
+                if '{' in segment:
+                    # Parameter embedded in literal text, e.g. /file-{id}
+                    return False
+                node = node.children.setdefault(sys.intern(segment), TrieNode())
+            else:
+                param_name, param_type = param.groups()
+                child = node.param_child
+                if child is None:
+                    child = node.param_child = TrieNode()
+                    child.param_name = param_name
+                    if param_type:
+                        child.param_pattern = _segment_pattern(param_type)
+                        # The pattern already guarantees convertibility
+                        child.param_converter = _CONVERTERS.get(param_type)
+                elif child.param_name != param_name or (
+                    child.param_pattern is not (
+                        _segment_pattern(param_type) if param_type else None
+                    )
+                ):
+                    # A different parameter already claims this position
+                    return False
+                node = child
+
+        for method in route.methods:
+            # First registration wins, matching the old linear scan
+            node.routes.setdefault(method, route)
+        return True
+
+    def _build_fallback_matchers(self) -> Dict[str, tuple]:
+        """Combine fallback routes into one alternation regex per method"""
+        by_method: Dict[str, List[Route]] = {}
+        for route in self._fallback_routes:
+            for method in route.methods:
+                by_method.setdefault(method, []).append(route)
+
+        matchers: Dict[str, tuple] = {}
+        for method, routes in by_method.items():
+            parts = []
+            group_maps = []
+            group_to_route = {}
+            group_count = 0
+            for index, route in enumerate(routes):
+                source = route.pattern.pattern
+                # Rename named groups so the same param name can appear in
+                # several alternatives
+                name_map = {}
+                for name in route.pattern.groupindex:
+                    alias = f'_g{index}_{name}'
+                    name_map[name] = alias
+                    source = source.replace(f'(?P<{name}>', f'(?P<{alias}>')
+                parts.append(f'(?P<_r{index}>{source})')
+                group_maps.append(name_map)
+                first_group = group_count + 1
+                group_count += 1 + route.pattern.groups
+                for number in range(first_group, group_count + 1):
+                    group_to_route[number] = index
+            matchers[method] = (re.compile('|'.join(parts)), routes, group_maps, group_to_route)
+
+        self._fallback_matchers = matchers
+        return matchers
+
+    def _match_trie(self, node: TrieNode, segments: List[str], index: int,
+                    method: str, params: Dict[str, Any]) -> Optional[Route]:
+        """Descend the trie, preferring literal children and backtracking to params"""
+        if index == len(segments):
+            return node.routes.get(method)
+
+        segment = segments[index]
+        child = node.children.get(segment)
+        if child is not None:
+            route = self._match_trie(child, segments, index + 1, method, params)
+            if route is not None:
+                return route
+
+        child = node.param_child
+        if child is not None and segment and (
+            child.param_pattern is None or child.param_pattern.fullmatch(segment)
+        ):
+            converter = child.param_converter
+            params[child.param_name] = converter(segment) if converter else segment
+            route = self._match_trie(child, segments, index + 1, method, params)
+            if route is not None:
+                return route
+            del params[child.param_name]
+
+        return None
+
+    def find_route(self, path: str, method: str) -> Optional[Tuple[Callable, Dict, RouteConfig, tuple, bool]]:
         """Find route with caching for performance"""
+        method = method.upper()
         cache_key = (path, method)
-        
-        if cache_key in self._route_cache:
-            return self._route_cache[cache_key]
-        
-        for route in self.routes:
-            params = route.match(path, method)
-            if params is not None:
-                result = (route.handler, params, route.config)
-                self._route_cache[cache_key] = result
+
+        route = self._static.get(cache_key)
+        if route is not None:
+            # Static routes carry no params, so every request shares one
+            # preassembled tuple -- zero allocations on this path
+            result = route._cached_result
+            if result is None:
+                result = route._cached_result = (
+                    route.handler, {}, route.config, route.arg_plan, route.is_coro
+                )
+            return result
+
+        cached = self._route_cache.get(cache_key)
+        if cached is not None:
+            self._route_cache.move_to_end(cache_key)
+            return cached
+
+        # Trie dispatch: O(path depth) regardless of route count
+        if path.startswith('/'):
+            params: Dict[str, Any] = {}
+            route = self._match_trie(self._root, path.split('/'), 1, method, params)
+            if route is not None:
+                result = (route.handler, params, route.config, route.arg_plan, route.is_coro)
+                self._cache_store(cache_key, result)
+                return result
+
+        # One find + set probe prunes most non-matching paths before the
+        # regex engine runs
+        if not self._any_first_segment:
+            end = path.find('/', 1)
+            first = path[1:end] if end != -1 else path[1:]
+            if first not in self._first_segments:
+                return None
+
+        matchers = self._fallback_matchers
+        if matchers is None:
+            matchers = self._build_fallback_matchers()
+        entry = matchers.get(method)
+        if entry is not None:
+            pattern, routes, group_maps, group_to_route = entry
+            match = pattern.fullmatch(path)
+            if match is not None and match.lastindex:
+                index = group_to_route[match.lastindex]
+                route = routes[index]
+                params = {
+                    name: match.group(alias)
+                    for name, alias in group_maps[index].items()
+                }
+                route._convert_params(params)
+                result = (route.handler, params, route.config, route.arg_plan, route.is_coro)
+                self._cache_store(cache_key, result)
                 return result
-        
+
         return None
\ No newline at end of file
@@ -30,16 +30,13 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
         "Topic :: Internet :: WWW/HTTP :: HTTP Servers",
         "Topic :: Software Development :: Libraries :: Application Frameworks",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.10",
     install_requires=requirements,
     extras_require={
         "dev": [
@@ -53,10 +50,12 @@ setup(
             "httpx>=0.24.0",
         ],
         "redis": ["redis>=4.5.0"],
+        "orjson": ["orjson>=3.8.0"],
         "full": [
             "uvicorn[standard]>=0.20.0",
             "redis>=4.5.0",
             "gunicorn>=20.1.0",
+            "orjson>=3.8.0",
         ],
     },
     entry_points={
@@ -1,18 +1,41 @@
-import re
 from typing import Any, Dict, get_type_hints
 from functools import wraps
 from .exceptions import ValidationError
 
+# Character classes from the old validation regexes, kept as frozensets so
+# the structural checks below preserve exactly what the patterns accepted
+_ALPHA = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_EMAIL_LOCAL_CHARS = _ALPHA | frozenset('0123456789._%+-')
+_EMAIL_DOMAIN_CHARS = _ALPHA | frozenset('0123456789.-')
+
 class Validator:
     @staticmethod
     def validate_email(value: str) -> bool:
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, value))
-    
+        # Structural scan of local@domain.tld, no regex engine involved
+        at = value.rfind('@')
+        if at <= 0 or at == len(value) - 1:
+            return False
+        domain = value[at + 1:]
+        dot = domain.rfind('.')
+        if dot <= 0:
+            return False
+        tld = domain[dot + 1:]
+        if len(tld) < 2 or not _ALPHA.issuperset(tld):
+            return False
+        return (
+            _EMAIL_LOCAL_CHARS.issuperset(value[:at])
+            and _EMAIL_DOMAIN_CHARS.issuperset(domain[:dot])
+        )
+
     @staticmethod
     def validate_phone(value: str) -> bool:
-        pattern = r'^\+?1?\d{9,15}$'
-        return bool(re.match(pattern, value))
+        # Optional '+', optional leading '1', then 9-15 digits
+        if value.startswith('+'):
+            value = value[1:]
+        if not value.isdecimal():
+            return False
+        n = len(value)
+        return 9 <= n <= 15 or (n == 16 and value[0] == '1')
     
     @staticmethod
     def validate_length(value: str, min_len: int = 0, max_len: int = None) -> bool:
@@ -20,33 +43,83 @@ class Validator:
             return min_len <= len(value) <= max_len
         return len(value) >= min_len
 
+def _compile_rules(validators: Dict[str, Any]) -> tuple:
+    """Normalize the rule spec once into (field, ((check, message), ...)) pairs
+
+    Each check returns True when the value passes; the messages are
+    formatted at compile time so the request path never builds strings.
+    """
+    plan = []
+    for field, rules in validators.items():
+        checks = []
+        for rule in rules if isinstance(rules, list) else [rules]:
+            if rule == 'required':
+                checks.append((
+                    lambda v: v is not None and v != '',
+                    f"{field} is required",
+                ))
+            elif rule == 'email':
+                checks.append((
+                    lambda v: not v or Validator.validate_email(v),
+                    f"{field} must be a valid email",
+                ))
+            elif rule == 'phone':
+                checks.append((
+                    lambda v: not v or Validator.validate_phone(v),
+                    f"{field} must be a valid phone number",
+                ))
+            elif isinstance(rule, dict):
+                min_len = rule.get('min_length')
+                max_len = rule.get('max_length')
+                if min_len is not None and max_len is not None:
+                    # Both bounds in one chained comparison: len() runs once
+                    checks.append((
+                        lambda v, min_len=min_len, max_len=max_len:
+                            not v or min_len <= len(v) <= max_len,
+                        f"{field} must be between {min_len} and {max_len} characters",
+                    ))
+                elif min_len is not None:
+                    checks.append((
+                        lambda v, min_len=min_len: not v or len(v) >= min_len,
+                        f"{field} must be at least {min_len} characters",
+                    ))
+                elif max_len is not None:
+                    checks.append((
+                        lambda v, max_len=max_len: not v or len(v) <= max_len,
+                        f"{field} must be at most {max_len} characters",
+                    ))
+        plan.append((field, tuple(checks)))
+    return tuple(plan)
+
 def validate(**validators):
     """Decorator for request validation"""
     def decorator(handler):
+        plan = _compile_rules(validators)
+        has_required = any(
+            rule == 'required'
+            for rules in validators.values()
+            for rule in (rules if isinstance(rules, list) else [rules])
+        )
+
         @wraps(handler)
         async def wrapper(request, *args, **kwargs):
+            if not has_required and not await request.body():
+                # Every rule passes on a missing value; skip the parse
+                return await handler(request, *args, **kwargs)
+
             data = await request.json() or {}
             errors = {}
-            
-            for field, rules in validators.items():
+
+            for field, checks in plan:
                 value = data.get(field)
-                
-                for rule in rules if isinstance(rules, list) else [rules]:
-                    if rule == 'required' and (value is None or value == ''):
-                        errors[field] = f"{field} is required"
-                    elif rule == 'email' and value and not Validator.validate_email(value):
-                        errors[field] = f"{field} must be a valid email"
-                    elif rule == 'phone' and value and not Validator.validate_phone(value):
-                        errors[field] = f"{field} must be a valid phone number"
-                    elif isinstance(rule, dict):
-                        if 'min_length' in rule and value and len(value) < rule['min_length']:
-                            errors[field] = f"{field} must be at least {rule['min_length']} characters"
-                        if 'max_length' in rule and value and len(value) > rule['max_length']:
-                            errors[field] = f"{field} must be at most {rule['max_length']} characters"
-            
+                for check, message in checks:
+                    if not check(value):
+                        # Last failing rule wins, as before
+                        errors[field] = message
+
             if errors:
                 raise ValidationError({"errors": errors})
-            
+
             return await handler(request, *args, **kwargs)
         return wrapper
     return decorator
\ No newline at end of file